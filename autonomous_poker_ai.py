@@ -1,6 +1,12 @@
 import re
-import random
+import itertools
+import functools
+import math
+import os
+import atexit
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
+import numpy as np
 from treys import Card, Deck, Evaluator
 
 from rich.console import Console
@@ -44,6 +50,11 @@ def print_hand(cards, prefix=""):
 # 1. MODELS: Player & Table & Pots
 # ==========================================
 class Player:
+    # Fixed slots keep the per-seat fields compact and make the attribute reads in
+    # the betting loop plain slot lookups instead of instance-dict hits.
+    __slots__ = ('name', 'stack', 'is_ai', 'hole_cards', 'is_active', 'is_all_in',
+                 'current_bet', 'total_invested', 'history')
+
     def __init__(self, name: str, stack: int, is_ai: bool = False):
         self.name = name
         self.stack = stack
@@ -80,12 +91,21 @@ class Player:
         return actual
 
 class Pot:
-    def __init__(self):
+    def __init__(self, table: "Table"):
+        self._table = table
         self.amount = 0
-        self.eligible_players = []
+        # Bit i is set while seat i can still win this pot
+        self.eligible_mask = 0
 
     def add(self, amount: int):
         self.amount += amount
+        self._table._total_pot += amount
+
+    def add_eligible(self, idx: int):
+        self.eligible_mask |= 1 << idx
+
+    def remove_eligible(self, idx: int):
+        self.eligible_mask &= ~(1 << idx)
 
 class Table:
     def __init__(self, small_blind: int, big_blind: int):
@@ -94,28 +114,43 @@ class Table:
         self.small_blind_amount = small_blind
         self.big_blind_amount = big_blind
         self.button_idx = 0
-        self.pots = [Pot()]
+        self._total_pot = 0
+        self.pots = [Pot(self)]
+        # Only folds and new hands change who is active, so the list is rebuilt lazily
+        self._active_cache = None
+        self.active_count = 0
 
     def add_player(self, player: Player):
         self.players.append(player)
+        self._active_cache = None
+        self.active_count += player.is_active
 
     def reset_for_hand(self):
         self.community_cards = []
-        self.pots = [Pot()]
-        for p in self.players:
+        self._total_pot = 0
+        self.pots = [Pot(self)]
+        for i, p in enumerate(self.players):
             p.reset_for_hand()
+            if p.is_active:
+                self.pots[0].add_eligible(i)
+        self._active_cache = None
+        self.active_count = sum(p.is_active for p in self.players)
 
     def get_total_pot_size(self):
-        return sum(pot.amount for pot in self.pots)
+        # Kept up to date by Pot.add, so no need to sum the pots on every refresh
+        return self._total_pot
         
     def get_active_players(self):
-        return [p for p in self.players if p.is_active]
+        if self._active_cache is None:
+            self._active_cache = [p for p in self.players if p.is_active]
+        return self._active_cache
 
 
 # ==========================================
 # 2. DECK MANAGER & INPUT VALIDATOR
 # ==========================================
 class DeckManager:
+    _WS_RE = re.compile(r'\s+')
     SUITS = {
         'SPADE': 's', 'SPADES': 's', 'HEART': 'h', 'HEARTS': 'h',
         'DIAMOND': 'd', 'DIAMONDS': 'd', 'CLUB': 'c', 'CLUBS': 'c'
@@ -126,39 +161,72 @@ class DeckManager:
         'EIGHT': '8', '8': '8', 'NINE': '9', '9': '9', 'TEN': 'T', '10': 'T',
         'JACK': 'J', 'QUEEN': 'Q', 'KING': 'K', 'ACE': 'A'
     }
+    _TOKENS = {**{k: ('R', v) for k, v in RANKS.items()}, **{k: ('S', v) for k, v in SUITS.items()}}
 
     def __init__(self):
         self.deck = Deck()
-        self.drawn_cards = set()
 
     def parse_card(self, card_str: str) -> int:
-        clean_str = re.sub(r'\s+', ' ', card_str.strip().upper())
+        raw = card_str.strip().upper()
+        # Typed input is usually single-spaced already ("ACE SPADES"), so skip the regex then
+        clean_str = raw if '  ' not in raw and raw.isprintable() else self._WS_RE.sub(' ', raw)
         parts = clean_str.split(' ')
         
-        suit_word, rank_word = None, None
-        if len(parts) == 2:
-            suit_word, rank_word = parts[0], parts[1]
-            if suit_word in self.RANKS and rank_word in self.SUITS:
-                suit_word, rank_word = rank_word, suit_word
-        elif len(parts) == 3 and parts[1] == "OF":
-            rank_word, suit_word = parts[0], parts[2]
-        else:
-            raise ValueError(f"Invalid format '{card_str}'. Use 'Suit Rank' (e.g., 'Diamond Nine').")
-                
-        if suit_word not in self.SUITS or rank_word not in self.RANKS:
+        if len(parts) == 1 and 2 <= len(clean_str) <= 3 and clean_str not in self._TOKENS:
+            # Terse form such as 'Ah' or '10h'
+            rank_char = self.RANKS.get(clean_str[:-1], clean_str[:-1])
+            suit_char = clean_str[-1].lower()
+            if len(rank_char) != 1 or rank_char not in Card.STR_RANKS or suit_char not in Card.CHAR_SUIT_TO_INT_SUIT:
+                raise ValueError("Invalid suit or rank.")
+            return Card.new(rank_char + suit_char)
+
+        of_form = len(parts) == 3 and parts[1] == "OF"
+        if of_form:
+            parts = [parts[0], parts[2]]
+        elif len(parts) != 2:
+            raise ValueError(f"Invalid format '{card_str}'. Use 'Suit Rank' (e.g., 'Diamond Nine') or 'Ah'.")
+
+        # One lookup per word tells us both what it is and its treys character
+        try:
+            (kind_a, char_a), (kind_b, char_b) = self._TOKENS[parts[0]], self._TOKENS[parts[1]]
+        except KeyError:
+            raise ValueError("Invalid suit or rank.") from None
+        # 'Rank of Suit' is the only order the "OF" form accepts
+        if kind_a == kind_b or (of_form and kind_a != 'R'):
             raise ValueError("Invalid suit or rank.")
-            
-        return Card.new(f"{self.RANKS[rank_word]}{self.SUITS[suit_word]}")
+
+        rank_char, suit_char = (char_a, char_b) if kind_a == 'R' else (char_b, char_a)
+        return Card.new(rank_char + suit_char)
 
     def draw_specific(self, card_str: str) -> int:
         card_int = self.parse_card(card_str)
-        if card_int in self.drawn_cards:
+        if card_int not in self.deck.cards:
             raise ValueError(f"Duplicate card detected: {Card.int_to_str(card_int)}")
-        self.drawn_cards.add(card_int)
-        if card_int in self.deck.cards:
-            self.deck.cards.remove(card_int)
+        self.deck.cards.remove(card_int)
         return card_int
 
+    def draw_many(self, card_strs: str, count: int | None = None) -> list[int]:
+        """Draws several cards from one line, either comma-separated ('Ace Spades, King Hearts')
+        or whitespace-separated terse cards ('Ah Kd Qs'). Nothing is drawn if any card is invalid."""
+        if ',' in card_strs:
+            tokens = card_strs.split(',')
+        else:
+            tokens = card_strs.split()
+            if any(t.upper() in self._TOKENS or t.upper() == 'OF' for t in tokens):
+                raise ValueError("Separate full card names with commas (e.g., 'Ace Spades, King Hearts, Queen Hearts')")
+        cards = [self.parse_card(t) for t in tokens if t.strip()]
+        if count is not None and len(cards) != count:
+            raise ValueError(f"Expected {count} cards, got {len(cards)}")
+
+        seen = set()
+        for card_int in cards:
+            if card_int in seen or card_int not in self.deck.cards:
+                raise ValueError(f"Duplicate card detected: {Card.int_to_str(card_int)}")
+            seen.add(card_int)
+        for card_int in cards:
+            self.deck.cards.remove(card_int)
+        return cards
+
 # ==========================================
 # 3. GAME STATE CONTROLLER
 # ==========================================
@@ -176,9 +244,13 @@ class GameController:
         self.current_idx = 0
         self.min_raise = table.big_blind_amount
         self.highest_bet = 0
-        self.acted_this_round = set()
+        self._players_needing_action = 0
+        self._legal_cache_key = None
+        self._legal_cache_val = None
         
     def start_hand(self):
+        _mc_sample.cache_clear()
+        self._legal_cache_key = None
         self.table.reset_for_hand()
         self.phase = GamePhase.PRE_FLOP
         self.table.button_idx = (self.table.button_idx + 1) % len(self.table.players)
@@ -193,29 +265,34 @@ class GameController:
         self.highest_bet = self.table.big_blind_amount
         self.min_raise = self.table.big_blind_amount
         self.current_idx = self._next_active(bb_idx)
-        self.acted_this_round = set()
+        self._players_needing_action = self._count_can_act()
 
     def _next_active(self, start_idx: int) -> int:
         n = len(self.table.players)
-        for i in range(1, n + 1):
-            idx = (start_idx + i) % n
+        if n == 2:
+            # Heads-up is the common case: "next" is simply the other seat, then our own
+            seats = ((start_idx + 1) % 2, start_idx % 2)
+        else:
+            seats = ((start_idx + i) % n for i in range(1, n + 1))
+        for idx in seats:
             p = self.table.players[idx]
             if p.is_active and not p.is_all_in: return idx
         return -1
 
-    def is_round_over(self) -> bool:
-        active_not_allin = [p for p in self.table.players if p.is_active and not p.is_all_in]
-        if len(active_not_allin) <= 1 and len(self.table.get_active_players()) > 1:
-            pass # Special case for all-ins needing calls
+    def _count_can_act(self) -> int:
+        return sum(1 for p in self.table.players if p.is_active and not p.is_all_in)
 
-        for i, p in enumerate(self.table.players):
-            if p.is_active and not p.is_all_in:
-                if i not in self.acted_this_round or p.current_bet < self.highest_bet:
-                    return False
-        return True
+    def is_round_over(self) -> bool:
+        return self._players_needing_action <= 0
 
     def get_legal_actions(self):
+        # Prompting, validating and the AI all ask for the same decision's actions;
+        # callers treat the returned dict as read-only so it can be shared.
         p = self.table.players[self.current_idx]
+        key = (self.current_idx, self.highest_bet, self.min_raise, p.stack, p.current_bet)
+        if key == self._legal_cache_key:
+            return self._legal_cache_val
+
         call_amt = self.highest_bet - p.current_bet
         actions = {"FOLD": True, "CALL": min(call_amt, p.stack)}
         actions["CHECK"] = call_amt == 0
@@ -225,6 +302,7 @@ class GameController:
             actions["RAISE_TO_MAX"] = p.stack + p.current_bet
         else:
             actions["RAISE_TO_MIN"] = actions["RAISE_TO_MAX"] = False
+        self._legal_cache_key, self._legal_cache_val = key, actions
         return actions
 
     def process_action(self, action: str, amount: int = 0):
@@ -233,6 +311,10 @@ class GameController:
         
         if action == 'FOLD':
             p.is_active = False
+            self.table._active_cache = None
+            self.table.active_count -= 1
+            for pot in self.table.pots:
+                pot.remove_eligible(self.current_idx)
         elif action == 'CHECK' and legal['CHECK']:
             pass
         elif action == 'CALL' and legal['CALL'] is not False:
@@ -253,83 +335,301 @@ class GameController:
             
             if amount - self.highest_bet >= self.min_raise:
                 self.min_raise = amount - self.highest_bet
-                self.acted_this_round = set()
             self.highest_bet = amount
         else:
             raise ValueError(f"Illegal action {action}")
 
-        self.acted_this_round.add(self.current_idx)
+        self._legal_cache_key = None
+        if action == 'RAISE':
+            # Everyone else still in (and not all-in) must respond to the new bet
+            self._players_needing_action = self._count_can_act() - (0 if p.is_all_in else 1)
+        else:
+            self._players_needing_action -= 1
         if not self.is_round_over():
             self.current_idx = self._next_active(self.current_idx)
 
     def advance_phase(self):
+        self._legal_cache_key = None
         self.phase = GamePhase(self.phase.value + 1)
         for p in self.table.players: p.reset_for_round()
         self.highest_bet = 0
         self.min_raise = self.table.big_blind_amount
-        self.acted_this_round = set()
+        self._players_needing_action = self._count_can_act()
         self.current_idx = self._next_active(self.table.button_idx)
 
 # ==========================================
 # 4. AI STRATEGY ENGINE & EVALUATOR
 # ==========================================
+class _EquitySample:
+    """Running per-board totals behind one Monte Carlo equity estimate."""
+    __slots__ = ('boards', 'n', 'score_sum', 'score_sq_sum')
+
+    def __init__(self):
+        self.boards = 0
+        self.n = 0
+        self.score_sum = 0.0
+        self.score_sq_sum = 0.0
+
+    def add(self, scores, rollouts_per_board: int):
+        self.boards += len(scores)
+        self.n += len(scores) * rollouts_per_board
+        self.score_sum += float(scores.sum())
+        self.score_sq_sum += float(scores @ scores)
+
+    @property
+    def equity(self) -> float:
+        return self.score_sum / self.boards
+
+    def standard_error(self) -> float:
+        # Rollouts dealt against the same board are correlated, so the per-board
+        # scores are the independent samples the variance has to come from.
+        p = self.equity
+        cluster_se = 0.0
+        if self.boards > 1:
+            var = (self.score_sq_sum - self.boards * p * p) / (self.boards - 1)
+            cluster_se = math.sqrt(max(var, 0.0) / self.boards)
+        # Agresti-Coull floor, so an estimate of exactly 0 or 1 never claims zero error
+        p_ac = (p * self.n + 2) / (self.n + 4)
+        return max(cluster_se, math.sqrt(p_ac * (1 - p_ac) / (self.n + 4)))
+
+@functools.lru_cache(maxsize=4096)
+def _mc_sample(hole_key: frozenset, board_key: frozenset, n_opp: int) -> _EquitySample:
+    """Running post-flop equity sample per (hole, board, opponents) state. Later
+    decisions on the same state extend it instead of starting over. Cleared every hand."""
+    return _EquitySample()
+
+def _usable_cpus() -> int:
+    """Cores this process may run on, which can be fewer than the host has."""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    if hasattr(os, 'process_cpu_count'):
+        return os.process_cpu_count() or 1
+    return os.cpu_count() or 1
+
+# Each worker process builds its own engine (and lookup tables, and RNG) once
+_worker_engine = None
+
+def _init_mc_worker():
+    global _worker_engine
+    _worker_engine = AIEngine()
+
+def _mc_worker_rollouts(pocket_cards, board_cards, iterations, num_opponents):
+    hole, board, available = _worker_engine._deal_arrays(pocket_cards, board_cards)
+    return _worker_engine._rollouts(hole, board, available, iterations, num_opponents)
+
 class AIEngine:
+    # Opponent hands sampled against each simulated board; the AI hand is only
+    # ranked once per board and compared against all of them.
+    OPPONENTS_PER_BOARD = 4
+
+    # Pre-flop equity only depends on the 169 canonical starting hands, so each
+    # (high_rank, low_rank, suited, num_opponents) bucket is simulated once with a
+    # large sample and then shared by every engine.
+    PREFLOP_ITERATIONS = 10000
+    _PREFLOP_EQUITY = {}
+
+    # Equities at which get_decision changes its mind. Sampling stops early once
+    # the estimate is tight or clearly on one side of every threshold.
+    VALUE_BET_EQUITY = 0.70
+    MC_BATCH = 50
+    MC_MIN_SAMPLES = 200
+    MC_TARGET_HALF_WIDTH = 0.03
+
+    # Fixed-size simulations that rank at least this many opponent hands are split
+    # across worker processes when more than one core is usable. The pool lives as
+    # long as the engine, so its start-up is paid once per session; each task after
+    # that costs ~1 ms of round trip, against ~20 ms serially for a 3-way pre-flop
+    # fill and ~75 ms for a 9-way one. Fills against 3+ opponents go parallel, while
+    # the adaptive post-flop batches are far too small to be worth shipping out.
+    PARALLEL_MIN_HANDS = 3 * PREFLOP_ITERATIONS
+
+    # Hands ranked per _evaluate_batch slice; bounds the (n, 21) temporaries to a few MB
+    EVAL_SLICE = 4096
+
     def __init__(self):
         self.evaluator = Evaluator()
-
-    def _monte_carlo_equity(self, pocket_cards, board_cards, iterations=500):
-        """Simulates `iterations` hands to estimate win probability."""
+        # The 52-card deck is static, so build it once instead of per simulation
+        self._full_deck = tuple(Deck.GetFullDeck())
+        self._rng = np.random.default_rng()
+        self._workers = _usable_cpus()
+        self._pool = None
+
+        # Flatten treys' lookup dicts into arrays so whole batches of hands can be
+        # ranked at once. Flushes are indexed directly by their 13-bit rank mask,
+        # everything else by its five ranks in ascending order packed 4 bits apiece.
+        self._flush_by_bits = np.zeros(1 << 13, dtype=np.int16)
+        for prime, rank in self.evaluator.table.flush_lookup.items():
+            bits = sum(1 << i for i, p in enumerate(Card.PRIMES) if prime % p == 0)
+            self._flush_by_bits[bits] = rank
+        self._unsuited_by_ranks = np.zeros(1 << 20, dtype=np.int16)
+        for prime, rank in self.evaluator.table.unsuited_lookup.items():
+            key, shift = 0, 0
+            for i, p in enumerate(Card.PRIMES):
+                while prime % p == 0:
+                    key |= i << shift
+                    shift += 4
+                    prime //= p
+            self._unsuited_by_ranks[key] = rank
+        self._combos = np.array(list(itertools.combinations(range(7), 5))).T  # (5, 21)
+
+    def _evaluate_batch(self, hands):
+        """Ranks an (n, 7) array of card ints, same scale as `Evaluator.evaluate`."""
+        if len(hands) <= self.EVAL_SLICE:
+            return self._evaluate_slice(hands)
+        scores = np.empty(len(hands), dtype=np.int16)
+        for start in range(0, len(hands), self.EVAL_SLICE):
+            scores[start:start + self.EVAL_SLICE] = self._evaluate_slice(hands[start:start + self.EVAL_SLICE])
+        return scores
+
+    def _evaluate_slice(self, hands):
+        # Card ints order by rank and each combination lists its card indices in
+        # increasing order, so once a hand is sorted every 5-card subset's ranks
+        # come out ascending and can be packed straight into a table index.
+        hands = np.sort(hands, axis=1)
+        cols = [hands[:, idx] for idx in self._combos]  # 5 x (n, 21): every 5-card subset
+        ranks = [(col >> 8) & 0xF for col in cols]
+
+        is_flush = cols[0] & cols[1] & cols[2] & cols[3] & cols[4] & 0xF000 != 0
+        rank_bits = (cols[0] | cols[1] | cols[2] | cols[3] | cols[4]) >> 16
+        unsuited = self._unsuited_by_ranks[ranks[0] | ranks[1] << 4 | ranks[2] << 8 | ranks[3] << 12 | ranks[4] << 16]
+        scores = np.where(is_flush, self._flush_by_bits[rank_bits & 0x1FFF], unsuited)
+        return scores.min(axis=1)
+
+    def _preflop_lookup(self, pocket_cards, num_opponents=1):
+        """Returns the cached equity of the starting hand's canonical bucket."""
+        r1, r2 = sorted([Card.get_rank_int(c) for c in pocket_cards], reverse=True)
+        suited = Card.get_suit_int(pocket_cards[0]) == Card.get_suit_int(pocket_cards[1])
+        key = (r1, r2, suited, num_opponents)
+        if key not in self._PREFLOP_EQUITY:
+            hand = [Card.new(Card.STR_RANKS[r1] + 's'), Card.new(Card.STR_RANKS[r2] + ('s' if suited else 'h'))]
+            self._PREFLOP_EQUITY[key] = self._simulate_equity(hand, [], self.PREFLOP_ITERATIONS, num_opponents)
+        return self._PREFLOP_EQUITY[key]
+
+    def _monte_carlo_equity(self, pocket_cards, board_cards, iterations=500, num_opponents=1, pot_odds=None):
+        """Estimates win probability against `num_opponents` random hands."""
         if not pocket_cards:
             return 0.0
+        if not board_cards:
+            return self._preflop_lookup(pocket_cards, num_opponents)
+        sample = _mc_sample(frozenset(pocket_cards), frozenset(board_cards), num_opponents)
+        return self._simulate_equity(pocket_cards, board_cards, iterations, num_opponents, pot_odds, sample)
+
+    def _simulate_equity(self, pocket_cards, board_cards, iterations, num_opponents=1, pot_odds=None, sample=None):
+        """Simulates up to `iterations` hands to estimate win probability.
+
+        Without `pot_odds` the rest of the sample is drawn in one batch, split across worker
+        processes once it reaches PARALLEL_MIN_HANDS. With it, rollouts run in batches
+        of MC_BATCH and, after MC_MIN_SAMPLES, stop once the 95% confidence interval is
+        narrow enough or neither the pot odds nor the value-bet threshold is within 4
+        standard errors. A `sample` carried over from an earlier call is extended in place.
+        """
+        hole, board, available = self._deal_arrays(pocket_cards, board_cards)
+        sample = _EquitySample() if sample is None else sample
+        while sample.n < iterations:
+            if pot_odds is None:
+                batch = iterations - sample.n
+            elif sample.n >= self.MC_MIN_SAMPLES and self._is_settled(sample, pot_odds):
+                break
+            else:
+                batch = min(self.MC_BATCH, iterations - sample.n)
 
-        wins = 0
-        ties = 0
-
-        # We need a clean deck to draw from for simulations
-        # Start with a full deck and remove known cards
+            if batch * num_opponents >= self.PARALLEL_MIN_HANDS and self._workers > 1:
+                scores, per_board = self._parallel_rollouts(pocket_cards, board_cards, batch, num_opponents)
+            else:
+                scores, per_board = self._rollouts(hole, board, available, batch, num_opponents)
+            sample.add(scores, per_board)
+        return sample.equity
+
+    def _is_settled(self, sample, pot_odds):
+        se = sample.standard_error()
+        if 1.96 * se < self.MC_TARGET_HALF_WIDTH:
+            return True
+        return all(abs(sample.equity - threshold) > 4 * se for threshold in (pot_odds, self.VALUE_BET_EQUITY))
+
+    def _deal_arrays(self, pocket_cards, board_cards):
+        """Returns the hole, board and remaining deck as int32 arrays."""
+        # Everything that stays fixed across batches is converted to arrays once, so
+        # each batch is pure array work with no per-card Python loops.
         known_cards = set(pocket_cards + board_cards)
-        
-        for _ in range(iterations):
-            # Create a fresh list of available cards for this simulation
-            full_deck = Deck()
-            available_cards = [c for c in full_deck.cards if c not in known_cards]
-            random.shuffle(available_cards)
-
-            # 1. Deal opponent cards
-            opp_cards = [available_cards.pop(), available_cards.pop()]
-
-            # 2. Deal remaining board cards
-            needed_board_cards = 5 - len(board_cards)
-            simulated_board = list(board_cards)
-            for _ in range(needed_board_cards):
-                simulated_board.append(available_cards.pop())
-
-            # 3. Evaluate hands
-            ai_rank = self.evaluator.evaluate(simulated_board, pocket_cards)
-            opp_rank = self.evaluator.evaluate(simulated_board, opp_cards)
-
-            # Lower rank is better in treys
-            if ai_rank < opp_rank:
-                wins += 1
-            elif ai_rank == opp_rank:
-                ties += 1
-
-        equity = (wins + (ties / 2)) / iterations
-        return equity
+        available = np.array([c for c in self._full_deck if c not in known_cards], dtype=np.int32)
+        return np.array(pocket_cards, dtype=np.int32), np.array(board_cards, dtype=np.int32), available
+
+    def _parallel_rollouts(self, pocket_cards, board_cards, iterations, num_opponents=1):
+        """Splits `iterations` evenly across worker processes and joins their per-board scores."""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self._workers, initializer=_init_mc_worker)
+            atexit.register(self.close)
+        chunk = iterations // self._workers
+        futures = [self._pool.submit(_mc_worker_rollouts, pocket_cards, board_cards, chunk, num_opponents)
+                   for _ in range(self._workers)]
+        scores, per_board = zip(*(f.result() for f in futures))
+        return np.concatenate(scores), per_board[0]
+
+    def close(self):
+        """Shuts down the worker pool, if one was started."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+            atexit.unregister(self.close)
+
+    def _rollouts(self, hole, board, available, iterations, num_opponents=1):
+        """Simulates about `iterations` hands from int32 card arrays.
+
+        Returns each simulated board's score (wins plus pot shares of chops, over its rollouts)
+        and the number of rollouts dealt against every board.
+        """
+        needed_board_cards = 5 - len(board)
+
+        # Multi-way pots need more cards per rollout, so fewer rollouts share a board.
+        k = max(1, min(self.OPPONENTS_PER_BOARD, (len(available) - needed_board_cards) // (2 * num_opponents)))
+        num_boards = max(1, iterations // k)
+        iterations = num_boards * k
+        cards_per_board = needed_board_cards + 2 * k * num_opponents
+
+        # One random key per (board, card): the `cards_per_board` smallest keys of each
+        # row pick its cards, and ordering them by key keeps the deal order uniform.
+        keys = self._rng.random((num_boards, len(available)))
+        idx = keys.argpartition(cards_per_board - 1, axis=1)[:, :cards_per_board]
+        idx = np.take_along_axis(idx, np.take_along_axis(keys, idx, axis=1).argsort(axis=1), axis=1)
+        draws = available[idx]
+
+        # 1. Deal remaining board cards, 2. Deal `k` sets of opponent hands against each board
+        simulated_boards = np.hstack([np.broadcast_to(board, (num_boards, len(board))), draws[:, :needed_board_cards]])
+        num_hands = iterations * num_opponents
+        opp_hands = draws[:, needed_board_cards:cards_per_board].reshape(num_hands, 2)
+
+        # 3. Evaluate hands, keeping the strongest opponent of each rollout
+        if needed_board_cards:
+            pocket = np.broadcast_to(hole, (num_boards, 2))
+            ai_ranks = np.repeat(self._evaluate_batch(np.hstack([pocket, simulated_boards])), k)
+        else:
+            # On the river every rollout shares the board, so the AI hand is ranked once
+            ai_ranks = self._evaluate_batch(np.concatenate([hole, board])[None])[0]
+        opp_ranks = self._evaluate_batch(np.hstack([opp_hands, np.repeat(simulated_boards, k * num_opponents, axis=0)]))
+        opp_ranks = opp_ranks.reshape(iterations, num_opponents)
+        ai_ranks = np.broadcast_to(ai_ranks, (iterations,))
+        best = opp_ranks.min(axis=1)
+        tied = (opp_ranks == ai_ranks[:, None]).sum(axis=1)
+
+        # Lower rank is better in treys; a chop splits the pot between everyone tied
+        outcomes = (ai_ranks < best) + (ai_ranks == best) / (1 + tied)
+        return outcomes.reshape(num_boards, k).mean(axis=1), k
 
     def get_decision(self, game: GameController, ai_player: Player):
         legal = game.get_legal_actions()
         pot = game.table.get_total_pot_size()
         to_call = legal.get('CALL', 0) if legal.get('CALL') else 0
         
-        # 1. Evaluate True Equity via Monte Carlo
-        equity = self._monte_carlo_equity(ai_player.hole_cards, game.table.community_cards)
-            
-        # 2. Pot Odds
+        # 1. Pot Odds
         pot_odds = to_call / (pot + to_call) if to_call > 0 else 0
 
+        # 2. Evaluate True Equity via Monte Carlo, sampling only until the decision is clear
+        num_opponents = max(1, game.table.active_count - 1)
+        equity = self._monte_carlo_equity(ai_player.hole_cards, game.table.community_cards,
+                                          num_opponents=num_opponents, pot_odds=pot_odds)
+
         # 3. Decision Logic (GTO/EV Inspired Simplified)
-        if equity > 0.70 and legal['RAISE_TO_MIN']:
+        if equity > self.VALUE_BET_EQUITY and legal['RAISE_TO_MIN']:
             min_raise_abs = game.highest_bet + game.min_raise
             target_amount = game.highest_bet + int(pot * (equity - 0.5)) # Bet bigger the larger our equity
             raise_size = max(min_raise_abs, target_amount)
@@ -396,15 +696,13 @@ def main():
     while game.phase != GamePhase.SHOWDOWN:
         console.print(f"\n[bold magenta]--- {game.phase.name} ---[/bold magenta]")
         if game.phase == GamePhase.FLOP:
-            console.print("[italic]Please input the 3 Flop cards:[/italic]")
-            board = []
-            for i in range(3):
-                while True:
-                    try:
-                        board.append(deck_mgr.draw_specific(console.input(f"    [bold]Card {i+1}:[/bold] ")))
-                        break
-                    except ValueError as e:
-                        console.print(f"    [bold red]Error: {e}. Please try again.[/bold red]")
+            console.print("[italic]Please input the 3 Flop cards (e.g. 'Ah Kd Qs' or 'Ace Spades, King Hearts, Queen Hearts'):[/italic]")
+            while True:
+                try:
+                    board = deck_mgr.draw_many(console.input("    [bold]Flop:[/bold] "), count=3)
+                    break
+                except ValueError as e:
+                    console.print(f"    [bold red]Error: {e}. Please try again.[/bold red]")
             table.community_cards.extend(board)
         elif game.phase in [GamePhase.TURN, GamePhase.RIVER]:
             while True:
@@ -418,7 +716,7 @@ def main():
         print_hand(table.community_cards, "\nBoard:")
         console.print(f"💰 [bold green]Pot: {table.get_total_pot_size()}[/bold green]\n")
         
-        if game.is_round_over() and len(table.get_active_players()) > 1:
+        if game.is_round_over() and table.active_count > 1:
             console.print("  [italic dim]-> Betting bypassed: Players are all-in![/italic dim]")
             
         while not game.is_round_over():
@@ -457,7 +755,7 @@ def main():
                         console.print(f"    [bold red]Invalid move: {e}[/bold red]")
                     
         # Check if hand ended early (everyone else folded)
-        if len(table.get_active_players()) == 1:
+        if table.active_count == 1:
             console.print(f"\n[bold yellow]*** {table.get_active_players()[0].name} wins by default! Everyone else folded. ***[/bold yellow]")
             break
             
@@ -524,9 +822,21 @@ def main():
                     winners.append(p)
             
             console.print(res_table)
-            pot_size = table.get_total_pot_size()
-            win_amount = pot_size // len(winners)
-            for w in winners:
+            winners_idx = [table.players.index(w) for w in winners]
+            winners_mask = 0
+            for i in winners_idx:
+                winners_mask |= 1 << i
+            win_amounts = dict.fromkeys(winners_idx, 0)
+            for pot in table.pots:
+                share_mask = pot.eligible_mask & winners_mask
+                if not share_mask:
+                    continue
+                share = pot.amount // share_mask.bit_count()
+                for i in winners_idx:
+                    if share_mask >> i & 1:
+                        win_amounts[i] += share
+            for i, win_amount in win_amounts.items():
+                w = table.players[i]
                 console.print(f"[bold yellow]🏆 *** {w.name} WINS {win_amount}! *** 🏆[/bold yellow]")
                 w.stack += win_amount
 
@@ -549,6 +859,7 @@ def main():
         
     console.print(stack_table)
     console.print("[dim]Hand Over.[/dim]")
+    ai.close()
 
 if __name__ == "__main__":
     main()
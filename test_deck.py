@@ -0,0 +1,34 @@
+import pytest
+from treys import Card
+from autonomous_poker_ai import DeckManager
+
+def test_parse_terse_and_words():
+    d = DeckManager()
+    assert d.parse_card('Ah') == Card.new('Ah')
+    assert d.parse_card('10h') == Card.new('Th')
+    assert d.parse_card('ace of spades') == Card.new('As')
+    # A lone rank word is a format problem, not a bad terse card
+    for word in ['ACE', 'TEN', '10']:
+        with pytest.raises(ValueError, match="Invalid format"):
+            d.parse_card(word)
+    with pytest.raises(ValueError, match="Invalid suit or rank"):
+        d.parse_card('Zx')
+    # The "of" form only reads rank first
+    with pytest.raises(ValueError, match="Invalid suit or rank"):
+        d.parse_card('spades of ace')
+
+def test_draw_many():
+    d = DeckManager()
+    assert d.draw_many('Ah Kd Qs', count=3) == [Card.new(c) for c in ['Ah', 'Kd', 'Qs']]
+    assert d.draw_many('Two Clubs, Three Hearts', count=2) == [Card.new('2c'), Card.new('3h')]
+    assert len(d.deck.cards) == 47
+
+def test_draw_many_rejects_without_drawing():
+    d = DeckManager()
+    d.draw_specific('Ah')
+    for line, msg in [('Jc Jc Qh', 'Duplicate'), ('Jc Ah Qh', 'Duplicate'), ('Jc Qh', 'Expected 3'),
+                      ('Ace Spades King Hearts Queen Hearts', 'commas')]:
+        with pytest.raises(ValueError, match=msg):
+            d.draw_many(line, count=3)
+    # Nothing from the rejected lines left the deck
+    assert len(d.deck.cards) == 51
@@ -0,0 +1,86 @@
+import random
+import pytest
+import numpy as np
+from treys import Card, Deck
+from autonomous_poker_ai import AIEngine, _EquitySample, _mc_sample
+
+def test_batch_matches_treys():
+    ai = AIEngine()
+    hands = [random.sample(Deck.GetFullDeck(), 7) for _ in range(5000)]  # more than one EVAL_SLICE
+    batch = ai._evaluate_batch(np.array(hands, dtype=np.int32))
+    for hand, rank in zip(hands, batch):
+        assert rank == ai.evaluator.evaluate(hand[:2], hand[2:])
+
+def test_equity_range():
+    ai = AIEngine()
+    aces = [Card.new('As'), Card.new('Ah')]
+    equity = ai._monte_carlo_equity(aces, [])
+    assert 0.75 < equity < 0.95
+
+    # Royal flush on the board is a guaranteed chop
+    board = [Card.new(c) for c in ['Ts', 'Js', 'Qs', 'Ks', 'As']]
+    assert ai._monte_carlo_equity([Card.new('2c'), Card.new('3d')], board) == 0.5
+
+def test_multiway_chop_share():
+    ai = AIEngine()
+    # Everyone plays the royal flush on the board, so the pot splits n + 1 ways
+    board = [Card.new(c) for c in ['Ts', 'Js', 'Qs', 'Ks', 'As']]
+    hole = [Card.new('2c'), Card.new('3d')]
+    assert ai._simulate_equity(hole, board, 500, 2) == pytest.approx(1 / 3)
+    assert ai._simulate_equity(hole, board, 500, 4) == pytest.approx(1 / 5)
+
+def test_adaptive_sample_floor():
+    ai = AIEngine()
+    # Quad aces on the river never lose, but one batch of wins is not enough to stop on
+    sample = _EquitySample()
+    board = [Card.new(c) for c in ['Ah', 'Ac', '7d', '2s', '9c']]
+    assert ai._simulate_equity([Card.new('As'), Card.new('Ad')], board, 500, 1, 0.3, sample) == 1.0
+    assert sample.n >= AIEngine.MC_MIN_SAMPLES
+
+def test_equity_cache_extends_sample(monkeypatch):
+    ai = AIEngine()
+    _mc_sample.cache_clear()
+    hole = [Card.new('9h'), Card.new('8h')]
+    board = [Card.new(c) for c in ['Th', 'Jc', '2h']]
+    ai._monte_carlo_equity(hole, board, iterations=200, pot_odds=0.3)
+    sample = _mc_sample(frozenset(hole), frozenset(board), 1)
+    n = sample.n
+
+    requested = []
+    rollouts = ai._rollouts
+    def spy(hole, board, available, iterations, num_opponents=1):
+        requested.append(iterations)
+        return rollouts(hole, board, available, iterations, num_opponents)
+    monkeypatch.setattr(ai, '_rollouts', spy)
+
+    # A later call on the same state only draws the rollouts the sample is missing
+    ai._monte_carlo_equity(hole, board, iterations=400)
+    assert _mc_sample(frozenset(hole), frozenset(board), 1) is sample
+    assert requested[0] == 400 - n
+    assert sum(requested) < 400
+    assert 400 <= sample.n < 400 + AIEngine.OPPONENTS_PER_BOARD
+
+def test_preflop_fill_uses_pool(monkeypatch):
+    ai = AIEngine()
+    ai._workers = 2
+    monkeypatch.setattr(AIEngine, '_PREFLOP_EQUITY', {})
+    try:
+        ai._preflop_lookup([Card.new('7c'), Card.new('2d')], 2)
+        assert ai._pool is None
+        ai._preflop_lookup([Card.new('7c'), Card.new('2d')], 3)
+        assert ai._pool is not None
+    finally:
+        ai.close()
+
+def test_parallel_rollouts():
+    ai = AIEngine()
+    ai._workers = 2
+    ai.PARALLEL_MIN_HANDS = 1000
+    try:
+        board = [Card.new(c) for c in ['2c', '7d', 'Kh']]
+        equity = ai._simulate_equity([Card.new('As'), Card.new('Ah')], board, 2000)
+        assert ai._pool is not None
+        assert 0.8 < equity < 0.95
+    finally:
+        ai.close()
+    assert ai._pool is None